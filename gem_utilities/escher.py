@@ -1,5 +1,7 @@
 import cobra
 import warnings
+from collections import Counter
+from itertools import chain
 
 
 def create_comparison_data_file(*models):
@@ -34,11 +36,6 @@ def create_comparison_data_file(*models):
 
     # Create a dictionary of reactions and the number of models they are
     # present in and return it
-    reaction_dict = {}
-    for model in models:
-        for reaction in model.reactions:
-            if reaction.id not in reaction_dict:
-                reaction_dict[reaction.id] = 1
-            else:
-                reaction_dict[reaction.id] += 1
-    return reaction_dict
+    reaction_counts = Counter(chain.from_iterable(
+        (reaction.id for reaction in model.reactions) for model in models))
+    return dict(reaction_counts)
@@ -1,3 +1,17 @@
+# The IDs of the reactants and products that are allowed in a
+# maintenance reaction, for each notation. Have to specify the
+# compartment of the metabolites, this may be a problem if different
+# models use different compartment IDs.
+# ATP and water are allowed reactants.
+# ADP, phosphate, and protons are allowed products.
+MAINTENANCE_MET_IDS = {
+    'modelseed': (frozenset(['cpd00002_c0', 'cpd00001_c0']),
+                  frozenset(['cpd00008_c0', 'cpd00009_c0', 'cpd00067_c0'])),
+    'bigg': (frozenset(['atp_c', 'h2o_c']),
+             frozenset(['adp_c', 'pi_c', 'h_c'])),
+}
+
+
 def is_maintenance_reaction(model, reaction, notation='ModelSEED'):
     """A function that checks if a specific reaction is a maintenace
     reaction by checking if the reaction has only ATP and water as
@@ -19,27 +33,18 @@ def is_maintenance_reaction(model, reaction, notation='ModelSEED'):
     bool
         True if the reaction is a maintenance reaction, False otherwise.
     """
-    # A list of the IDs of the reactants and products that are allowed
-    # in a maintenance reaction. Have to specify the compartment of the
-    # metabolites, this may be a problem if different models use
-    # different compartment IDs.
-    # ATP and water are allowed reactants.
-    # ADP, phosphate, and protons are allowed products.
-    if notation.lower() == 'modelseed':
-        allowed_reactants = ['cpd00002_c0', 'cpd00001_c0']
-        allowed_products = ['cpd00008_c0', 'cpd00009_c0', 'cpd00067_c0']
-    elif notation.lower() == 'bigg':
-        allowed_reactants = ['atp_c', 'h2o_c']
-        allowed_products = ['adp_c', 'pi_c', 'h_c']
-    else:
+    # Look up the allowed reactant and product IDs for the notation
+    if notation.lower() not in MAINTENANCE_MET_IDS:
         raise ValueError('The notation provided (' + notation + ') is not ',
                          'valid. Please use "ModelSEED" or "BiGG".')
+    allowed_reactants, allowed_products = MAINTENANCE_MET_IDS[
+        notation.lower()]
 
     # Check if the reaction has only the allowed reactants and products
     # in any order.
-    if any(met.id not in allowed_reactants for met in reaction.reactants):
+    if not {met.id for met in reaction.reactants} <= allowed_reactants:
         return False
-    if any(met.id not in allowed_products for met in reaction.products):
+    if not {met.id for met in reaction.products} <= allowed_products:
         return False
     else:
         return True
@@ -65,6 +70,11 @@ def find_maintenance_reaction(model):
 
     maintenace_rxns = []
     for reaction in model.reactions:
+        # A maintenance reaction has at most 5 metabolites (ATP, water,
+        # ADP, phosphate, and protons), so skip anything larger without
+        # checking the metabolite IDs.
+        if len(reaction.metabolites) > 5:
+            continue
         if is_maintenance_reaction(model, reaction):
             maintenace_rxns.append(reaction)
     # If there is only one maintenance reaction, return it.
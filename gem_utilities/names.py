@@ -1,3 +1,7 @@
+# Compartment suffixes that can be trimmed from metabolite names
+COMPARTMENT_SUFFIXES = ('[c]', '[e]')
+
+
 def fix_names_w_compartment_suffix(model):
     """Fix metabolite names with a compartment suffix.
 
@@ -8,19 +12,12 @@ def fix_names_w_compartment_suffix(model):
         None
 
     """
-    # Find metabolites with a compartment suffix
-    names_w_compartment_suffix = find_names_w_compartment_suffix(model)
-
-    # Fix the metabolite names
-    for id in names_w_compartment_suffix:
-        # Trim the compartment suffix
-        trimmed_name = trim_name(names_w_compartment_suffix[id])
-
-        # Find the metabolite with the compartment suffix
-        met = model.metabolites.get_by_id(id)
-
-        # Change the metabolite name
-        met.name = trimmed_name
+    # Fix the names of metabolites with a compartment suffix in a single
+    # pass, rather than looking each one up again by ID
+    for met in model.metabolites:
+        if met.name.endswith(COMPARTMENT_SUFFIXES):
+            # Trim the compartment suffix
+            met.name = trim_name(met.name)
 
     return None
 
@@ -35,11 +32,8 @@ def trim_name(name):
         str: The cobra metabolite name without the compartment suffix.
 
     """
-    # Get the compartment suffix
-    suffix = name[-3:]
-
     # Check that the compartment suffix is valid
-    if suffix not in ['[c]', '[e]']:
+    if not name.endswith(COMPARTMENT_SUFFIXES):
         raise ValueError('The compartment suffix is not valid.')
 
     # Trim the compartment suffix
@@ -59,6 +53,6 @@ def find_names_w_compartment_suffix(model):
 
     """
     # Find metabolites with a compartment suffix
-    names_w_compartment_suffix = {met.id: met.name for met in model.metabolites if met.name[-3:] in ['[c]', '[e]']}
+    names_w_compartment_suffix = {met.id: met.name for met in model.metabolites if met.name.endswith(COMPARTMENT_SUFFIXES)}
 
     return names_w_compartment_suffix